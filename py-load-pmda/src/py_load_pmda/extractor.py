@@ -8,6 +8,10 @@ from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup, Tag
 
+# Size of the chunks a download is written to disk in. Downloads such as the JADER
+# archive are large, and small chunks cost a Python-level loop iteration each.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class BaseExtractor:
     """
@@ -107,7 +111,9 @@ class BaseExtractor:
         local_filepath = self.cache_dir / local_filename
 
         headers = {}
-        if last_state:
+        # Only ask the server to validate the cached copy if there is one. Otherwise
+        # a 304 would leave us without the file, e.g. after the cache was cleared.
+        if last_state and local_filepath.is_file():
             if "etag" in last_state:
                 headers["If-None-Match"] = last_state["etag"]
             if "last_modified" in last_state:
@@ -125,7 +131,7 @@ class BaseExtractor:
 
                 # If we get here, it's a 200 OK, so we download the file
                 with open(local_filepath, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
+                    for chunk in r.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
                 logging.info(f"File '{local_filename}' downloaded successfully.")
 
@@ -293,7 +299,7 @@ class PackageInsertsExtractor(BaseExtractor):
                 # Step 1: GET the search page to acquire a valid session token (nccharset)
                 logging.info("Fetching search page to get a session token...")
                 get_response = self._send_request(self.search_url)
-                get_soup = BeautifulSoup(get_response.text, "html.parser")
+                get_soup = BeautifulSoup(get_response.text, "lxml")
                 token_tag = get_soup.find("input", {"name": "nccharset"})
                 if not isinstance(token_tag, Tag) or not token_tag.has_attr("value"):
                     raise ValueError("Could not find the 'nccharset' token on the search page.")
@@ -308,7 +314,7 @@ class PackageInsertsExtractor(BaseExtractor):
                     self.search_url, data=form_data, headers=headers
                 )
                 post_response.encoding = post_response.apparent_encoding
-                soup = BeautifulSoup(post_response.text, "html.parser")
+                soup = BeautifulSoup(post_response.text, "lxml")
 
                 # Step 2: Intelligently parse the search results table to find the correct PDF.
                 main_content = soup.find("div", id="ContentMainArea")
@@ -412,7 +418,7 @@ class ReviewReportsExtractor(BaseExtractor):
             try:
                 logging.info("Fetching search page to get a session token...")
                 get_response = self._send_request(self.search_url)
-                get_soup = BeautifulSoup(get_response.text, "html.parser")
+                get_soup = BeautifulSoup(get_response.text, "lxml")
                 token_tag = get_soup.find("input", {"name": "nccharset"})
                 if not isinstance(token_tag, Tag) or not token_tag.has_attr("value"):
                     raise ValueError("Could not find the 'nccharset' token on the search page.")
@@ -425,7 +431,7 @@ class ReviewReportsExtractor(BaseExtractor):
                     self.search_url, data=form_data, headers=headers
                 )
                 post_response.encoding = post_response.apparent_encoding
-                soup = BeautifulSoup(post_response.text, "html.parser")
+                soup = BeautifulSoup(post_response.text, "lxml")
 
                 main_content = soup.find("div", id="ContentMainArea")
                 if not isinstance(main_content, Tag):
@@ -1,5 +1,6 @@
 import io
 import logging
+import re
 import zipfile
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -140,6 +141,13 @@ class ApprovalsParser:
                 f"DataFrame is missing columns that should have been parsed from the source: {missing_cols}"
             )
 
+    # Runs of whitespace (including newlines) in header cells, compiled once for
+    # the class since it is applied to every candidate header row and column name.
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+
+    # Number of leading rows searched for the header row.
+    HEADER_SEARCH_LIMIT = 10
+
     COLUMN_MAPPING = {
         "No.": "approval_id",
         "申請区分": "application_type",
@@ -154,11 +162,13 @@ class ApprovalsParser:
         """Renames DataFrame columns based on the COLUMN_MAPPING."""
         return df.rename(columns=self.COLUMN_MAPPING)
 
-    def _find_header_row(self, df: pd.DataFrame, keyword: str, search_limit: int = 10) -> int:
+    def _find_header_row(
+        self, df: pd.DataFrame, keyword: str, search_limit: int = HEADER_SEARCH_LIMIT
+    ) -> int:
         """Finds the header row index by searching for a keyword."""
         for i, row in df.head(search_limit).iterrows():
             # Normalize the row content by removing whitespace before searching
-            normalized_row = row.astype(str).str.replace(r"\s+", "", regex=True)
+            normalized_row = row.astype(str).str.replace(self.WHITESPACE_PATTERN, "", regex=True)
             if normalized_row.str.contains(keyword, na=False).any():
                 return int(i)
         raise ValueError(
@@ -180,8 +190,10 @@ class ApprovalsParser:
 
         try:
             logging.info(f"Parsing Excel file: {file_path}")
-            # First, read without a header to inspect the content
-            df_no_header = pd.read_excel(file_path, header=None)
+            # First, read the leading rows without a header to inspect the content.
+            # Only the rows searched for the header are needed, so the rest of the
+            # sheet is not parsed twice.
+            df_no_header = pd.read_excel(file_path, header=None, nrows=self.HEADER_SEARCH_LIMIT)
 
             # Find the actual header row by looking for a known column name.
             header_row_index = self._find_header_row(df_no_header, "販売名")
@@ -190,8 +202,9 @@ class ApprovalsParser:
             logging.info(f"Found header at row index {header_row_index}. Re-parsing...")
             df = pd.read_excel(file_path, header=header_row_index)
 
-            # Clean up column names (remove newlines and spaces)
-            df.columns = df.columns.str.strip().str.replace(r"\s+", "", regex=True)
+            # Clean up column names (remove newlines and spaces). The regex removes
+            # all whitespace, leading and trailing included, so no separate strip.
+            df.columns = df.columns.str.replace(self.WHITESPACE_PATTERN, "", regex=True)
 
             # Forward-fill the values in the first three columns to handle merged cells
             # This must be done BEFORE renaming, using the original column names.
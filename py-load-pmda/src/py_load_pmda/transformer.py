@@ -10,12 +10,70 @@ import pandas as pd
 
 from py_load_pmda import utils
 
+# Resolving the installed distribution's metadata is comparatively expensive,
+# so look the version up once at import time rather than per transform.
+_PIPELINE_VERSION = version("py-load-pmda")
+
+
+def _column_to_list(column: pd.Series) -> List[Any]:
+    """
+    Returns the values of a column as Python objects, with pd.NA as None the way
+    DataFrame.to_dict writes it. Only object and extension columns can hold pd.NA.
+    """
+    values = column.tolist()
+    if column.dtype == object or isinstance(column.dtype, pd.api.extensions.ExtensionDtype):
+        return [None if value is pd.NA else value for value in values]
+    return values
+
+
+def _serialize_pdf_raw_data(full_text: str, tables: List[pd.DataFrame]) -> Tuple[str, str]:
+    """
+    Serializes the full text and tables of a parsed PDF into the raw_data_full
+    JSON document and returns it together with the SHA-256 of its UTF-8 bytes.
+    """
+    # Build the row records from plain Python lists; DataFrame.to_dict boxes
+    # every cell individually and is far slower for the same output. Each column
+    # is converted on its own so it keeps its dtype.
+    tables_as_dicts = []
+    for df in tables:
+        columns = df.columns.tolist()
+        column_values = [_column_to_list(df.iloc[:, i]) for i in range(len(columns))]
+        tables_as_dicts.append([dict(zip(columns, row)) for row in zip(*column_values)])
+
+    raw_data_full = {
+        "source_file_type": "pdf",
+        "full_text": full_text,
+        "extracted_tables": tables_as_dicts,
+    }
+    raw_data_full_json = json.dumps(raw_data_full, ensure_ascii=False)
+    content_hash = hashlib.sha256(raw_data_full_json.encode("utf-8")).hexdigest()
+    return raw_data_full_json, content_hash
+
+
+def _fill_missing_aggregates(
+    df_agg: pd.DataFrame, first_columns: List[str], text_columns: List[str]
+) -> None:
+    """
+    Fills missing values in the aggregated approvals in place: text fields with
+    no values become empty strings and, as groupby's "first" yields for object
+    columns, other missing object values become None.
+    """
+    for col in first_columns:
+        if df_agg[col].dtype == object:
+            values: pd.Series = df_agg[col].astype(object)
+            df_agg[col] = values.where(values.notna(), other=None)
+    for col in text_columns:
+        df_agg[col] = df_agg[col].fillna("")
+
 
 class ApprovalsTransformer:
     """
     Transforms the raw DataFrame of New Drug Approvals into a standardized format.
     """
 
+    # Free-text fields whose distinct values are newline-joined per approval.
+    TEXT_COLUMNS = ["brand_name_jp", "generic_name_jp", "applicant_name_jp", "indication"]
+
     def __init__(self, source_url: str):
         self.source_url = source_url
 
@@ -29,9 +87,10 @@ class ApprovalsTransformer:
 
         df = pd.concat(dfs, ignore_index=True)
 
-        # 1. Preserve original data for the raw_data_full column before any changes
-        # The `to_json` call will be done during aggregation.
-        df["original_row"] = df.to_dict(orient="records")
+        # 1. Preserve original data for the raw_data_full column before any changes.
+        # One JSON object per row, split on the "\n" record separator only.
+        row_json = df.to_json(orient="records", lines=True, force_ascii=False)
+        df["original_row"] = row_json.split("\n")[:-1] if not df.empty else []
 
         # The parser already renamed the columns. The transformer's job is to aggregate.
         # Convert approval_date to a proper date object
@@ -42,23 +101,54 @@ class ApprovalsTransformer:
         agg_funcs = {
             "application_type": "first",
             "approval_date": "first",
-            "brand_name_jp": lambda x: "\n".join(x.dropna().unique()),
-            "generic_name_jp": lambda x: "\n".join(x.dropna().unique()),
-            "applicant_name_jp": lambda x: "\n".join(x.dropna().unique()),
-            "indication": lambda x: "\n".join(x.dropna().unique()),
-            # Use pandas' to_json, which correctly handles NaN -> null conversion.
-            "original_row": lambda x: pd.Series(list(x)).to_json(
-                orient="values", force_ascii=False
-            ),
         }
 
         # Select only columns that exist in the dataframe to avoid errors during aggregation
         cols_to_agg = {k: v for k, v in agg_funcs.items() if k in df.columns}
+        text_cols = [col for col in self.TEXT_COLUMNS if col in df.columns]
 
         # 5. Group by approval_id and aggregate. Do not drop rows where approval_id is NA.
-        df_agg = df.groupby("approval_id", dropna=False).agg(cols_to_agg).reset_index()
-
-        # Rename the aggregated 'original_row' to 'raw_data_full'
+        if not df["approval_id"].duplicated().any():
+            # Every approval is a single row (several NA IDs count as duplicates, since
+            # they form one group), so aggregation would be a no-op. Reproduce the
+            # groupby output directly: rows ordered by approval_id with NA last and
+            # each raw row on its own.
+            df_agg: pd.DataFrame = df.sort_values(
+                "approval_id", kind="stable", na_position="last", ignore_index=True
+            )
+            df_agg = df_agg[["approval_id", *cols_to_agg, "original_row", *text_cols]]
+        else:
+            grouped = df.groupby("approval_id", dropna=False)
+            df_agg = grouped.agg(cols_to_agg)
+
+            # Join each approval's row JSON by indexing its group positions directly,
+            # which avoids the per-group Series that .agg() builds for a Python callable.
+            row_values = df["original_row"].to_numpy()
+            joined_rows = pd.Series(
+                {
+                    key: ",".join(row_values[positions])
+                    for key, positions in grouped.indices.items()
+                },
+                dtype=object,
+            )
+            df_agg["original_row"] = joined_rows.reindex(df_agg.index)
+
+            # Deduplicate each text field up front so the per-group join is a plain
+            # str.join over values already in first-seen order, rather than a Python
+            # lambda calling dropna().unique() on every group.
+            for col in text_cols:
+                values = df[["approval_id", col]]
+                is_first_seen = ~values.duplicated()
+                unique_values = values[is_first_seen & values[col].notna()]
+                joined = unique_values.groupby("approval_id", dropna=False)[col].agg("\n".join)
+                df_agg[col] = joined.reindex(df_agg.index)
+
+            df_agg = df_agg.reset_index()
+
+        _fill_missing_aggregates(df_agg, list(cols_to_agg), text_cols)
+
+        # Wrap the joined rows into a JSON array and rename to 'raw_data_full'
+        df_agg["original_row"] = "[" + df_agg["original_row"].astype(str) + "]"
         df_agg.rename(columns={"original_row": "raw_data_full"}, inplace=True)
 
         # The approval_id might be a float if there were NaNs, so we can't cast to int yet.
@@ -71,11 +161,13 @@ class ApprovalsTransformer:
         # 6. Add metadata columns
         df_agg["_meta_load_ts_utc"] = datetime.now(timezone.utc)
         df_agg["_meta_source_url"] = self.source_url
-        df_agg["_meta_pipeline_version"] = version("py-load-pmda")
-        # Hash can fail on non-string data, ensure raw_data_full is a string
-        df_agg["_meta_source_content_hash"] = df_agg["raw_data_full"].astype(str).apply(
-            lambda x: hashlib.sha256(x.encode("utf-8")).hexdigest()
-        )
+        df_agg["_meta_pipeline_version"] = _PIPELINE_VERSION
+        # Hash can fail on non-string data, ensure raw_data_full is a string.
+        # A list comprehension avoids the per-element dispatch of Series.apply.
+        df_agg["_meta_source_content_hash"] = [
+            hashlib.sha256(x.encode("utf-8")).hexdigest()
+            for x in df_agg["raw_data_full"].astype(str).tolist()
+        ]
         df_agg["review_report_url"] = None  # Add missing column
 
         # 7. Select and order columns for the final schema
@@ -110,7 +202,7 @@ class JaderTransformer:
 
     def __init__(self, source_url: str):
         self.source_url = source_url
-        self.pipeline_version = version("py-load-pmda")
+        self.pipeline_version = _PIPELINE_VERSION
         self.extraction_ts = datetime.now(timezone.utc)
 
         # Mappings from Japanese source columns to English schema columns
@@ -151,9 +243,9 @@ class JaderTransformer:
         df["_meta_extraction_ts_utc"] = self.extraction_ts
         df["_meta_source_url"] = self.source_url
         df["_meta_pipeline_version"] = self.pipeline_version
-        df["_meta_source_content_hash"] = df["raw_data_full"].apply(
-            lambda x: hashlib.sha256(x.encode("utf-8")).hexdigest()
-        )
+        df["_meta_source_content_hash"] = [
+            hashlib.sha256(x.encode("utf-8")).hexdigest() for x in df["raw_data_full"].tolist()
+        ]
         return df
 
     def _generate_hash_id(self, df: pd.DataFrame, id_col_name: str) -> pd.DataFrame:
@@ -172,14 +264,21 @@ class JaderTransformer:
                 return None
             return str(o)  # Fallback to string representation
 
-        df[id_col_name] = df.apply(
-            lambda row: hashlib.sha256(
+        # Build each row's dict from plain lists rather than df.apply(axis=1), which
+        # creates a Series per row. to_numpy() interleaves the columns exactly as
+        # row-wise access did, so the hashes (and thus the IDs) are unchanged; only
+        # datetime64 values are boxed to Timestamps instead of integer nanoseconds.
+        values = df[cols_to_hash].to_numpy()
+        if values.dtype.kind in "mM":
+            values = df[cols_to_hash].astype(object).to_numpy()
+        df[id_col_name] = [
+            hashlib.sha256(
                 json.dumps(
-                    row[cols_to_hash].to_dict(), sort_keys=True, default=default_converter
+                    dict(zip(cols_to_hash, row)), sort_keys=True, default=default_converter
                 ).encode("utf-8")
-            ).hexdigest(),
-            axis=1,
-        )
+            ).hexdigest()
+            for row in values.tolist()
+        ]
         return df
 
     def transform(self, data_frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
@@ -201,23 +300,27 @@ class JaderTransformer:
                 continue
 
             logging.info(f"Transforming data for '{table_name}'...")
-            df = df_raw.copy()
 
             # 1. Create the raw_data_full column for high-fidelity audit trails
-            df["raw_data_full"] = df.to_json(
+            # Split on the record separator only, not on every Unicode line break.
+            raw_data_full = df_raw.to_json(
                 orient="records", lines=True, force_ascii=False
-            ).splitlines()
+            ).split("\n")[:-1]
 
             # 2. Rename columns from Japanese to standard English names
             rename_map = self.COLUMN_MAPS.get(table_name, {})
-            df.rename(columns=rename_map, inplace=True)
 
             # Drop original columns that were not in the rename map, except the primary key
             schema_cols = list(rename_map.values())
             if "identification_number" not in schema_cols:
                 schema_cols.append("identification_number")
 
-            df = df[schema_cols + ["raw_data_full"]]
+            # Renaming without a copy and then selecting the schema columns copies only
+            # the columns that are kept, and leaves the parser's DataFrame untouched.
+            # pandas-stubs omits rename's copy parameter, which pandas 2.x still honours.
+            renamed = df_raw.rename(columns=rename_map, copy=False)  # type: ignore[call-overload]
+            df = renamed[schema_cols]
+            df["raw_data_full"] = raw_data_full
 
             # 3. Handle special data transformations
             if table_name == "jader_reac" and "onset_date" in df.columns:
@@ -247,6 +350,9 @@ class PackageInsertsTransformer:
 
     def __init__(self, source_url: str):
         self.source_url = source_url
+        # The document ID depends only on the source URL, so compute it once.
+        self.document_id = hashlib.sha256(source_url.encode("utf-8")).hexdigest()
+        self.pipeline_version = _PIPELINE_VERSION
 
     def transform(self, parsed_data: Tuple[str, List[pd.DataFrame]]) -> pd.DataFrame:
         """
@@ -257,27 +363,17 @@ class PackageInsertsTransformer:
         if not full_text and not tables:
             return pd.DataFrame()
 
-        # Convert tables to dicts for JSON serialization
-        tables_as_dicts = [df.to_dict(orient="records") for df in tables]
-
-        raw_data_full = {
-            "source_file_type": "pdf",
-            "full_text": full_text,
-            "extracted_tables": tables_as_dicts,
-        }
-        raw_data_full_json = json.dumps(raw_data_full, ensure_ascii=False)
-        document_id = hashlib.sha256(self.source_url.encode("utf-8")).hexdigest()
+        raw_data_full_json, content_hash = _serialize_pdf_raw_data(full_text, tables)
+        now = datetime.now(timezone.utc)
 
         transformed_data = {
-            "document_id": document_id,
+            "document_id": self.document_id,
             "raw_data_full": raw_data_full_json,
             "_meta_source_url": self.source_url,
-            "_meta_extraction_ts_utc": datetime.now(timezone.utc),
-            "_meta_load_ts_utc": datetime.now(timezone.utc),
-            "_meta_pipeline_version": version("py-load-pmda"),
-            "_meta_source_content_hash": hashlib.sha256(
-                raw_data_full_json.encode("utf-8")
-            ).hexdigest(),
+            "_meta_extraction_ts_utc": now,
+            "_meta_load_ts_utc": now,
+            "_meta_pipeline_version": self.pipeline_version,
+            "_meta_source_content_hash": content_hash,
         }
         return pd.DataFrame([transformed_data])
 
@@ -287,31 +383,39 @@ class ReviewReportsTransformer:
     Transforms parsed data from a Review Report PDF into a structured format.
     """
 
+    # Keywords that introduce a "<keyword>: <value>" line in the report header.
+    KEYWORDS = ["販売名", "一般的名称", "申請者名", "申請年月日", "承認年月日"]
+
+    # A single alternation over all keywords, compiled once for the class, so the
+    # header lines are found in one scan of the text instead of one per keyword.
+    KEYWORD_PATTERN = re.compile("^(" + "|".join(KEYWORDS) + "): (.*)$", re.MULTILINE)
+    # Find the keyword and capture everything after it until the next major section.
+    # This is less brittle than assuming what the next section starts with.
+    SUMMARY_PATTERN = re.compile(r"審査の概要\s*\n(.*?)(?=\n\s*\d+\.|\Z)", re.DOTALL)
+
     def __init__(self, source_url: str) -> None:
         self.source_url = source_url
+        # The document ID depends only on the source URL, so compute it once.
+        self.document_id = hashlib.sha256(source_url.encode("utf-8")).hexdigest()
+        self.pipeline_version = _PIPELINE_VERSION
 
-    def _find_value_after_keyword(self, text: str, keyword: str) -> Optional[str]:
-        """Finds the first non-empty string on the same line after a keyword."""
-        try:
-            pattern = re.compile(f"^{keyword}: (.*)$", re.MULTILINE)
-            match = pattern.search(text)
-            if match:
-                return match.group(1).strip()
-        except Exception:
-            pass
-        return None
+    def _find_keyword_values(self, text: str) -> Dict[str, str]:
+        """
+        Finds the string on the same line after each keyword. Only the first
+        occurrence of a keyword is kept; keywords that are not found are omitted.
+        """
+        values: Dict[str, str] = {}
+        for match in self.KEYWORD_PATTERN.finditer(text):
+            values.setdefault(match.group(1), match.group(2).strip())
+            if len(values) == len(self.KEYWORDS):
+                break
+        return values
 
     def _find_summary(self, text: str) -> Optional[str]:
         """Extracts the summary section of the report."""
-        try:
-            # Simpler regex: find the keyword and capture everything after it until the next major section
-            # This is less brittle than assuming what the next section starts with.
-            pattern = re.compile(r"審査の概要\s*\n(.*?)(?=\n\s*\d+\.|\Z)", re.DOTALL)
-            match = pattern.search(text)
-            if match:
-                return match.group(1).strip()
-        except Exception:
-            pass
+        match = self.SUMMARY_PATTERN.search(text)
+        if match:
+            return match.group(1).strip()
         return None
 
     def transform(self, parsed_data: Tuple[str, List[pd.DataFrame]]) -> pd.DataFrame:
@@ -323,33 +427,25 @@ class ReviewReportsTransformer:
             return pd.DataFrame()
 
         # 1. Extract structured data using regex and keyword searches
-        brand_name = self._find_value_after_keyword(full_text, "販売名")
-        generic_name = self._find_value_after_keyword(full_text, "一般的名称")
-        applicant = self._find_value_after_keyword(full_text, "申請者名")
-        app_date_str = self._find_value_after_keyword(full_text, "申請年月日")
+        values = self._find_keyword_values(full_text)
+        brand_name = values.get("販売名")
+        generic_name = values.get("一般的名称")
+        applicant = values.get("申請者名")
+        app_date_str = values.get("申請年月日")
         app_date = utils.to_iso_date(pd.Series([app_date_str]))[0]
-        approval_date_str = self._find_value_after_keyword(full_text, "承認年月日")
+        approval_date_str = values.get("承認年月日")
         approval_date = utils.to_iso_date(pd.Series([approval_date_str]))[0]
         summary = self._find_summary(full_text)
 
-        # 2. Create the high-fidelity raw_data_full column
-        tables_as_dicts = [df.to_dict(orient="records") for df in tables]
-        raw_data_full = {
-            "source_file_type": "pdf",
-            "full_text": full_text,
-            "extracted_tables": tables_as_dicts,
-        }
-        raw_data_full_json = json.dumps(raw_data_full, ensure_ascii=False)
+        # 2. Create the high-fidelity raw_data_full column and its content hash
+        raw_data_full_json, content_hash = _serialize_pdf_raw_data(full_text, tables)
 
-        # 3. Create the document ID and metadata
-        document_id = hashlib.sha256(self.source_url.encode("utf-8")).hexdigest()
-        content_hash = hashlib.sha256(raw_data_full_json.encode("utf-8")).hexdigest()
+        # 3. Create the metadata
         now = datetime.now(timezone.utc)
-        pipeline_version = version("py-load-pmda")
 
         # 4. Assemble the final DataFrame
         transformed_data = {
-            "document_id": document_id,
+            "document_id": self.document_id,
             "brand_name_jp": brand_name,
             "generic_name_jp": generic_name,
             "applicant_name_jp": applicant,
@@ -360,7 +456,7 @@ class ReviewReportsTransformer:
             "_meta_source_url": self.source_url,
             "_meta_extraction_ts_utc": now,
             "_meta_load_ts_utc": now,  # Placeholder
-            "_meta_pipeline_version": pipeline_version,
+            "_meta_pipeline_version": self.pipeline_version,
             "_meta_source_content_hash": content_hash,
         }
 
@@ -1,10 +1,31 @@
 import logging
+import re
+import warnings
+from datetime import date
 from typing import Any
 
 import chardet
 import pandas as pd
 from jpdatetime import jpdatetime
 
+# Number of leading bytes passed to chardet when detecting an encoding.
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Byte sequences that chardet can tell apart from plain ASCII even in 7-bit data:
+# NULs (UTF-16/32 without a BOM) and the ISO-2022 and HZ escape sequences.
+_NON_PLAIN_ASCII_MARKERS = (b"\x00", b"\x1b", b"~{")
+
+# First Gregorian year of each modern Japanese era, for Wareki dates.
+_WAREKI_ERA_START_YEARS = {"明治": 1868, "大正": 1912, "昭和": 1926, "平成": 1989, "令和": 2019}
+
+# The common "<era><year>年<month>月<day>日" form with Arabic numerals (half- or
+# full-width). Anything else, such as kanji numerals or older eras, is left to
+# jpdatetime.
+_WAREKI_PATTERN = re.compile(
+    "(" + "|".join(_WAREKI_ERA_START_YEARS) + ")"
+    r"(元|[0-9０-９]{1,2})年([0-9０-９]{1,2})月([0-9０-９]{1,2})日"
+)
+
 
 def to_iso_date(series: pd.Series) -> pd.Series:
     """
@@ -13,15 +34,36 @@ def to_iso_date(series: pd.Series) -> pd.Series:
     parsing.
     """
 
+    # Date columns repeat the same few values heavily, so parse each distinct value
+    # once and broadcast the results back by position. Missing values are kept as a
+    # value of their own so the result has the dtype apply() would have inferred.
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+
+    # 1. Try standard `pd.to_datetime` first. It handles many common formats.
+    # All distinct strings are parsed in one vectorized call; format="mixed" infers
+    # the format of each value on its own, as parsing them one by one did.
+    # The `errors='coerce'` flag will return NaT for parsing failures.
+    texts = [d for d in uniques if isinstance(d, str)]
+    cleaned = [d.replace("年", "-").replace("月", "-").replace("日", "") for d in texts]
+    with warnings.catch_warnings():
+        # Mixed UTC offsets are handled below; pandas warns about them here.
+        warnings.simplefilter("ignore", FutureWarning)
+        standard_dates = pd.to_datetime(
+            pd.Series(cleaned, dtype=object), format="mixed", errors="coerce"
+        )
+    if not pd.api.types.is_datetime64_any_dtype(standard_dates):
+        # Values with different UTC offsets cannot share a datetime64 column, in
+        # which case pandas hands back the input; parse those one by one instead.
+        standard_dates = pd.Series(
+            [pd.to_datetime(d, errors="coerce") for d in cleaned], dtype=object
+        )
+    standard_by_text = dict(zip(texts, standard_dates))
+
     def convert_single_date(d: Any) -> Any:
         if pd.isna(d) or not isinstance(d, str):
             return pd.NaT
 
-        # 1. Try standard `pd.to_datetime` first. It handles many common formats.
-        # The `errors='coerce'` flag will return NaT for parsing failures.
-        dt = pd.to_datetime(
-            d.replace("年", "-").replace("月", "-").replace("日", ""), errors="coerce"
-        )
+        dt = standard_by_text[d]
         if pd.notna(dt):
             return dt.date()
 
@@ -30,6 +72,13 @@ def to_iso_date(series: pd.Series) -> pd.Series:
         try:
             # Clean the string for parsing
             clean_d = d.strip().replace(" ", "").replace("　", "")
+            # Resolve the common form directly from the era table. jpdatetime builds
+            # its pattern over every historical era on each call, which is much slower.
+            match = _WAREKI_PATTERN.fullmatch(clean_d)
+            if match:
+                era, era_year, month, day = match.groups()
+                offset = 0 if era_year == "元" else int(era_year) - 1
+                return date(_WAREKI_ERA_START_YEARS[era] + offset, int(month), int(day))
             # The format "%G年%m月%d日" interprets the era name and year together (%G).
             # The library correctly handles "元年" for the first year of an era,
             # as well as Arabic numerals for the year.
@@ -40,7 +89,10 @@ def to_iso_date(series: pd.Series) -> pd.Series:
             logging.debug(f"Could not parse date: {d}")
             return pd.NaT
 
-    return series.apply(convert_single_date)
+    result = pd.Series(uniques).apply(convert_single_date).take(codes)
+    result.index = series.index
+    result.name = series.name
+    return result
 
 
 def detect_encoding(data: bytes, fallback: str = "utf-8") -> str:
@@ -48,7 +100,18 @@ def detect_encoding(data: bytes, fallback: str = "utf-8") -> str:
     if not isinstance(data, bytes) or not data:
         return fallback
 
-    result = chardet.detect(data)
+    # chardet reports plain ASCII text as "ascii" only after scanning every byte,
+    # which bytes.isascii() does in C.
+    if data.isascii() and not any(marker in data for marker in _NON_PLAIN_ASCII_MARKERS):
+        logging.debug("Detected encoding: 'ascii' (no non-ASCII bytes).")
+        return "ascii"
+
+    # chardet's statistics settle long before the end of a large file, and running
+    # it over a whole JADER CSV takes tens of seconds, so only sniff a prefix. An
+    # all-ASCII prefix says nothing about the rest, so then check the full buffer.
+    result = chardet.detect(data[:_ENCODING_SAMPLE_SIZE])
+    if result.get("encoding") == "ascii" and len(data) > _ENCODING_SAMPLE_SIZE:
+        result = chardet.detect(data)
     encoding = result.get("encoding")
     confidence = result.get("confidence", 0)
 
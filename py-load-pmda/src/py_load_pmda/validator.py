@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import pandas as pd
 
@@ -22,6 +22,9 @@ class DataValidator:
         """
         self.rules = rules
         self.errors: List[str] = []
+        # Coerced columns keyed by (column, "numeric" | "datetime"), shared by the
+        # rules of a single validate() run.
+        self._coerced_columns: Dict[Tuple[str, str], pd.Series] = {}
 
     def validate(self, df: pd.DataFrame) -> bool:
         """
@@ -35,6 +38,7 @@ class DataValidator:
             failures are stored in the `self.errors` list.
         """
         self.errors = []
+        self._coerced_columns = {}
         if self.rules is None:
             logging.info("No validation rules provided, skipping validation.")
             return True
@@ -59,6 +63,7 @@ class DataValidator:
                     f"Error during validation check '{rule['check']}' on column '{column}': {e}"
                 )
 
+        self._coerced_columns = {}
         if self.errors:
             for error in self.errors:
                 logging.error(f"Data validation failure: {error}")
@@ -67,16 +72,27 @@ class DataValidator:
         logging.info("Data validation successful.")
         return True
 
+    def _coerce(self, df: pd.DataFrame, column: str, kind: str) -> pd.Series:
+        """Coerces a column to numeric or datetime once per validation run."""
+        key = (column, kind)
+        if key not in self._coerced_columns:
+            if kind == "numeric":
+                self._coerced_columns[key] = pd.to_numeric(df[column], errors="coerce")
+            else:
+                self._coerced_columns[key] = pd.to_datetime(df[column], errors="coerce")
+        return self._coerced_columns[key]
+
     def _check_not_null(self, df: pd.DataFrame, column: str, **kwargs: Any) -> None:
         """Checks for null values in a column."""
-        if df[column].isnull().any():
-            null_count = df[column].isnull().sum()
+        null_count = df[column].isnull().sum()
+        if null_count:
             self.errors.append(f"Column '{column}' has {null_count} null values.")
 
     def _check_is_unique(self, df: pd.DataFrame, column: str, **kwargs: Any) -> None:
         """Checks for duplicate values in a column."""
-        if not df[column].is_unique:
-            duplicates = df[df.duplicated(subset=[column])][column].nunique()
+        duplicated = df[column].duplicated()
+        if duplicated.any():
+            duplicates = df[column][duplicated].nunique()
             self.errors.append(
                 f"Column '{column}' is not unique. Found {duplicates} duplicate values."
             )
@@ -86,13 +102,13 @@ class DataValidator:
         try:
             if type == "integer":
                 # Check if all non-null values are integers
-                if not pd.to_numeric(df[column], errors="coerce").notna().all():
+                if not self._coerce(df, column, "numeric").notna().all():
                     self.errors.append(f"Column '{column}' contains non-integer values.")
             elif type == "float":
-                if not pd.to_numeric(df[column], errors="coerce").notna().all():
+                if not self._coerce(df, column, "numeric").notna().all():
                     self.errors.append(f"Column '{column}' contains non-float values.")
             elif type == "datetime":
-                if pd.to_datetime(df[column], errors="coerce").isnull().any():
+                if self._coerce(df, column, "datetime").isnull().any():
                     self.errors.append(f"Column '{column}' contains non-datetime values.")
             else:
                 # For other types, we can just check the dtype
@@ -112,20 +128,20 @@ class DataValidator:
         **kwargs: Any,
     ) -> None:
         """Checks if values in a numeric column are within a specified range."""
-        if not pd.to_numeric(df[column], errors="coerce").between(min_value, max_value).all():
-            out_of_range = df[
-                ~pd.to_numeric(df[column], errors="coerce").between(min_value, max_value)
-            ]
+        out_of_range = ~self._coerce(df, column, "numeric").between(min_value, max_value)
+        out_of_range_count = out_of_range.sum()
+        if out_of_range_count:
             self.errors.append(
-                f"Column '{column}' has {len(out_of_range)} values outside the range [{min_value}, {max_value}]."
+                f"Column '{column}' has {out_of_range_count} values outside the range [{min_value}, {max_value}]."
             )
 
     def _check_is_in_set(
         self, df: pd.DataFrame, column: str, allowed_values: List[Any], **kwargs: Any
     ) -> None:
         """Checks if all values in a column are from a specified set."""
-        if not df[column].isin(allowed_values).all():
-            invalid_values = df[~df[column].isin(allowed_values)][column].unique()
+        invalid = ~df[column].isin(allowed_values)
+        if invalid.any():
+            invalid_values = df[column][invalid].unique()
             self.errors.append(
                 f"Column '{column}' contains values not in the allowed set: {list(invalid_values)}"
             )
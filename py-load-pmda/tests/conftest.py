@@ -3,10 +3,15 @@ import uuid
 from typing import Generator, Tuple
 
 import pytest
+from testcontainers.core.config import testcontainers_config
 from testcontainers.postgres import PostgresContainer
 
 from py_load_pmda.adapters.postgres import PostgreSQLAdapter
 
+# Seconds between readiness probes while the PostgreSQL container starts up.
+# testcontainers defaults to a full second.
+_CONTAINER_POLL_INTERVAL = 0.1
+
 
 def pytest_ignore_collect(path, config):
     """
@@ -28,15 +33,57 @@ def pytest_ignore_collect(path, config):
     return False
 
 
+def pytest_addoption(parser):
+    """Registers the option that opts in to the Docker-backed integration tests."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked as 'integration' (requires Docker)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skips integration tests unless `--run-integration` is given, so the default
+    run stays fast and does not need Docker.
+
+    Every test that needs the PostgreSQL container is also kept on one xdist
+    worker. With `pytest -n auto --dist loadgroup` the other tests fan out
+    across all workers, while only a single worker ever starts a container.
+    """
+    if not config.getoption("--run-integration"):
+        skip_integration = pytest.mark.skip(reason="needs --run-integration to run")
+        for item in items:
+            if "integration" in item.keywords:
+                item.add_marker(skip_integration)
+
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        if "postgres_container" in item.fixturenames:
+            item.add_marker(pytest.mark.xdist_group("postgres"))
+
+
 @pytest.fixture(scope="session")
 def postgres_container() -> PostgresContainer:
     """
     Pytest fixture that starts a PostgreSQL container for the test session.
     The container will be automatically stopped at the end of the session.
     """
-    # Using a specific, lightweight image for reproducibility
-    with PostgresContainer("postgres:16-alpine") as postgres:
-        yield postgres
+    # Using a specific, lightweight image for reproducibility. The database is thrown
+    # away after the session, so durability is switched off to speed up the loads.
+    container = PostgresContainer("postgres:16-alpine").with_command(
+        "postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off"
+    )
+    # Only the start-up wait polls faster; the global setting is restored afterwards.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(testcontainers_config, "sleep_time", _CONTAINER_POLL_INTERVAL)
+        container.start()
+    try:
+        yield container
+    finally:
+        container.stop()
 
 
 @pytest.fixture(scope="function")
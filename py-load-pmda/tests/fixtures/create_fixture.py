@@ -1,8 +1,8 @@
+import csv
+import io
 import zipfile
 from pathlib import Path
 
-import pandas as pd
-
 
 def create_jader_test_fixture() -> None:
     """
@@ -39,13 +39,15 @@ def create_jader_test_fixture() -> None:
         "HIST.csv": hist_data,
     }
 
-    # Create a zip file and write each CSV into it with Shift-JIS encoding
-    with zipfile.ZipFile(output_zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    # Create a zip file and write each CSV into it with Shift-JIS encoding.
+    # The files are a few hundred bytes each, so they are stored uncompressed.
+    with zipfile.ZipFile(output_zip_path, "w", zipfile.ZIP_STORED) as zf:
         for filename, data in data_map.items():
-            df = pd.DataFrame(data)
-            # Use pandas to_csv with the correct encoding
-            csv_bytes = df.to_csv(index=False, encoding="shift_jis").encode("shift_jis")
-            zf.writestr(filename, csv_bytes)
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(data.keys())
+            writer.writerows(zip(*data.values()))
+            zf.writestr(filename, buffer.getvalue().encode("shift_jis"))
 
     print(f"Successfully created test fixture: {output_zip_path}")
 
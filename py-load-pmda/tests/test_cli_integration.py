@@ -2,7 +2,6 @@ import os
 
 import psycopg2
 import pytest
-from testcontainers.postgres import PostgresContainer
 from typer.testing import CliRunner
 
 from py_load_pmda.cli import app
@@ -11,38 +10,23 @@ from py_load_pmda.cli import app
 runner = CliRunner()
 
 
-@pytest.fixture(scope="module")
-def postgres_container():
-    """
-    A module-scoped fixture that starts a PostgreSQL container,
-    yields it, and then stops it after all tests in the module have run.
-    """
-    with PostgresContainer("postgres:16-alpine") as container:
-        yield container
-
-
 @pytest.fixture(scope="module")
 def set_db_env_vars(postgres_container):
     """
     A module-scoped fixture that sets the necessary database connection
     environment variables before any tests in the module run.
-    This uses the details from the running postgres_container.
+    This uses the details from the session-wide postgres_container.
     """
-    os.environ["PMDA_DB_HOST"] = postgres_container.get_container_host_ip()
-    os.environ["PMDA_DB_PORT"] = str(postgres_container.get_exposed_port(5432))
-    os.environ["PMDA_DB_USER"] = postgres_container.username
-    os.environ["PMDA_DB_PASSWORD"] = postgres_container.password
-    os.environ["PMDA_DB_DBNAME"] = postgres_container.dbname
-    # Ensure the 'type' is set for the get_db_adapter function
-    os.environ["PMDA_DB_TYPE"] = "postgres"
-    # Yield and then clean up the environment variables
-    yield
-    del os.environ["PMDA_DB_HOST"]
-    del os.environ["PMDA_DB_PORT"]
-    del os.environ["PMDA_DB_USER"]
-    del os.environ["PMDA_DB_PASSWORD"]
-    del os.environ["PMDA_DB_DBNAME"]
-    del os.environ["PMDA_DB_TYPE"]
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PMDA_DB_HOST", postgres_container.get_container_host_ip())
+        mp.setenv("PMDA_DB_PORT", str(postgres_container.get_exposed_port(5432)))
+        mp.setenv("PMDA_DB_USER", postgres_container.username)
+        mp.setenv("PMDA_DB_PASSWORD", postgres_container.password)
+        mp.setenv("PMDA_DB_DBNAME", postgres_container.dbname)
+        # Ensure the 'type' is set for the get_db_adapter function
+        mp.setenv("PMDA_DB_TYPE", "postgres")
+        # The environment variables are restored when the context exits
+        yield
 
 
 @pytest.mark.integration
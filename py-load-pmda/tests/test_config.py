@@ -1,25 +1,23 @@
 from pathlib import Path
 
 import pytest
-import yaml
 
 from py_load_pmda.config import load_config
 
+_CONFIG_YAML = """\
+database:
+  type: postgres
+  host: localhost
+  port: 5432
+  user: testuser
+"""
+
 
 @pytest.fixture
 def temp_config_file(tmp_path: Path) -> Path:
     """Creates a temporary config file for testing."""
-    config_data = {
-        "database": {
-            "type": "postgres",
-            "host": "localhost",
-            "port": 5432,
-            "user": "testuser",
-        }
-    }
     config_path = tmp_path / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(config_data, f)
+    config_path.write_text(_CONFIG_YAML)
     return config_path
 
 
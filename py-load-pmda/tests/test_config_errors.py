@@ -1,4 +1,3 @@
-import os
 import pytest
 from py_load_pmda.config import load_config
 
@@ -1,3 +1,4 @@
+import json
 from datetime import date
 from pathlib import Path
 from typing import Any, Dict, List
@@ -93,3 +94,116 @@ def test_approvals_transformer(sample_raw_df: pd.DataFrame) -> None:
     assert "approval_date" in transformed_df.columns
     assert transformed_df.iloc[0]["approval_date"] == date(2025, 5, 19)
     assert transformed_df.iloc[1]["approval_date"] == date(1989, 6, 1)
+
+
+def test_approvals_transformer_raw_data_full() -> None:
+    """
+    Tests that raw_data_full holds a JSON array of the original rows for each
+    aggregated approval, with missing values serialized as null.
+    """
+    raw_df = pd.DataFrame(
+        {
+            "application_type": ["第1", "第1", "第2"],
+            "approval_date": ["令和7年2月2日", "令和7年2月2日", "令和7年1月1日"],
+            "approval_id": [2.0, 2.0, 1.0],
+            "brand_name_jp": ["Drug B", None, "Drug A"],
+            "generic_name_jp": ["Generic B1", "Generic B2", "Generic A"],
+        }
+    )
+    transformer = ApprovalsTransformer(source_url="http://fake.url")
+
+    transformed_df = transformer.transform([raw_df])
+
+    raw_rows = json.loads(transformed_df.iloc[1]["raw_data_full"])
+    assert transformed_df.iloc[1]["approval_id"] == 2
+    assert raw_rows == [
+        {
+            "application_type": "第1",
+            "approval_date": "令和7年2月2日",
+            "approval_id": 2.0,
+            "brand_name_jp": "Drug B",
+            "generic_name_jp": "Generic B1",
+        },
+        {
+            "application_type": "第1",
+            "approval_date": "令和7年2月2日",
+            "approval_id": 2.0,
+            "brand_name_jp": None,
+            "generic_name_jp": "Generic B2",
+        },
+    ]
+    assert len(json.loads(transformed_df.iloc[0]["raw_data_full"])) == 1
+
+
+def test_approvals_transformer_raw_data_full_datetime_column() -> None:
+    """
+    Tests that datetime cells read from Excel are kept in raw_data_full as epoch
+    milliseconds.
+    """
+    raw_df = pd.DataFrame(
+        {
+            "application_type": ["第1"],
+            "approval_date": pd.to_datetime(["2025-05-19"]),
+            "approval_id": [1.0],
+            "brand_name_jp": ["Drug A"],
+        }
+    )
+    transformer = ApprovalsTransformer(source_url="http://fake.url")
+
+    transformed_df = transformer.transform([raw_df])
+
+    raw_rows = json.loads(transformed_df.iloc[0]["raw_data_full"])
+    assert raw_rows[0]["approval_date"] == 1747612800000
+
+
+def test_approvals_transformer_unique_approval_ids() -> None:
+    """
+    Tests that input without repeated approval IDs produces the same shape as the
+    aggregated path: one row per ID, sorted, with missing text as empty strings.
+    """
+    raw_df = pd.DataFrame(
+        {
+            "application_type": ["第2", None],
+            "approval_date": ["令和7年1月1日", None],
+            "approval_id": [2.0, 1.0],
+            "brand_name_jp": ["Drug B", None],
+            "generic_name_jp": ["Generic B", "Generic A"],
+        }
+    )
+    transformer = ApprovalsTransformer(source_url="http://fake.url")
+
+    transformed_df = transformer.transform([raw_df])
+
+    assert transformed_df["approval_id"].tolist() == [1, 2]
+    assert transformed_df["brand_name_jp"].tolist() == ["", "Drug B"]
+    assert transformed_df["generic_name_jp"].tolist() == ["Generic A", "Generic B"]
+    assert transformed_df.iloc[0]["application_type"] is None
+    assert json.loads(transformed_df.iloc[1]["raw_data_full"]) == [
+        {
+            "application_type": "第2",
+            "approval_date": "令和7年1月1日",
+            "approval_id": 2.0,
+            "brand_name_jp": "Drug B",
+            "generic_name_jp": "Generic B",
+        }
+    ]
+
+
+def test_approvals_transformer_raw_data_full_line_separator_in_text() -> None:
+    """
+    Tests that Unicode line separators inside a value do not split the row when
+    building raw_data_full.
+    """
+    raw_df = pd.DataFrame(
+        {
+            "approval_date": ["令和7年1月1日", "令和7年1月1日"],
+            "approval_id": [1.0, 1.0],
+            "indication": ["効能\u2028効果", "用法\x85用量"],
+        }
+    )
+    transformer = ApprovalsTransformer(source_url="http://fake.url")
+
+    transformed_df = transformer.transform([raw_df])
+
+    raw_rows = json.loads(transformed_df.iloc[0]["raw_data_full"])
+    assert [row["indication"] for row in raw_rows] == ["効能\u2028効果", "用法\x85用量"]
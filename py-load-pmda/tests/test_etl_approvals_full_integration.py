@@ -1,7 +1,8 @@
+from pathlib import Path
+
 import pytest
 import pandas as pd
 from testcontainers.postgres import PostgresContainer
-import requests_mock
 
 from py_load_pmda.adapters.postgres import PostgreSQLAdapter
 from py_load_pmda.orchestrator import Orchestrator
@@ -51,7 +52,7 @@ def mocked_approvals_requests(requests_mock):
 
     # Fixture for the 2025 Excel file download
     excel_url = "https://www.pmda.go.jp/files/approvals_2025.xlsx"
-    excel_content = open("tests/fixtures/approvals_2025.xlsx", "rb").read()
+    excel_content = (Path(__file__).parent / "fixtures" / "approvals_2025.xlsx").read_bytes()
     requests_mock.get(excel_url, content=excel_content)
 
 def test_approvals_etl_full_pipeline(
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
@@ -100,6 +102,33 @@ def test_jader_transformer(
     assert transformed_data["jader_hist"]["identification_number"].isin(demo_ids).all()
 
 
+def test_jader_transformer_hash_id(jader_transformer: JaderTransformer) -> None:
+    """
+    Tests that generated IDs are the SHA-256 of each row's sorted JSON, with
+    missing values hashed as null and other non-JSON types as strings.
+    """
+    df = pd.DataFrame(
+        {
+            "identification_number": ["AB123", "AB124"],
+            "drug_name": ["薬A", None],
+            "count": [1, 2],
+            "raw_data_full": ["{}", "{}"],
+        }
+    )
+
+    result = jader_transformer._generate_hash_id(df, "drug_id")
+
+    expected_rows = [
+        {"count": 1, "drug_name": "薬A", "identification_number": "AB123"},
+        {"count": 2, "drug_name": None, "identification_number": "AB124"},
+    ]
+    expected_ids = [
+        hashlib.sha256(json.dumps(row, sort_keys=True).encode("utf-8")).hexdigest()
+        for row in expected_rows
+    ]
+    assert result["drug_id"].tolist() == expected_ids
+
+
 @pytest.mark.skip(reason="Requires a running database and is out of scope for this task")
 @pytest.mark.e2e
 def test_jader_cli_pipeline(jader_test_zip: Path, mocker: Any) -> None:
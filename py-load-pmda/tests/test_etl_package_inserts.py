@@ -143,3 +143,33 @@ def test_package_inserts_transformer() -> None:
     assert len(raw_data["extracted_tables"]) == 1
     assert len(raw_data["extracted_tables"][0]) == 2
     assert raw_data["extracted_tables"][0][0]["col1"] == "A"
+    assert raw_data["extracted_tables"][0][1] == {"col1": "B", "col2": 2}
+
+
+def test_package_inserts_transformer_mixed_numeric_table() -> None:
+    """Tests that int cells stay ints in raw_data_full next to float columns."""
+    raw_df = pd.DataFrame({"count": [1, 2], "dose": [0.5, 2.0]})
+    transformer = PackageInsertsTransformer(source_url="https://www.pmda.go.jp/dummy.pdf")
+
+    transformed_df = transformer.transform(("text", [raw_df]))
+
+    raw_data_full = transformed_df.iloc[0]["raw_data_full"]
+    assert '"count": 1, "dose": 0.5' in raw_data_full
+    assert json.loads(raw_data_full)["extracted_tables"][0] == [
+        {"count": 1, "dose": 0.5},
+        {"count": 2, "dose": 2.0},
+    ]
+
+
+def test_package_inserts_transformer_nullable_table() -> None:
+    """Tests that missing values in nullable extension columns become JSON null."""
+    raw_df = pd.DataFrame({"count": pd.array([1, None], dtype="Int64"), "unit": ["mg", None]})
+    transformer = PackageInsertsTransformer(source_url="https://www.pmda.go.jp/dummy.pdf")
+
+    transformed_df = transformer.transform(("text", [raw_df]))
+
+    raw_data = json.loads(transformed_df.iloc[0]["raw_data_full"])
+    assert raw_data["extracted_tables"][0] == [
+        {"count": 1, "unit": "mg"},
+        {"count": None, "unit": None},
+    ]
@@ -94,6 +94,16 @@ def test_review_reports_transformer_unit():
     assert df.iloc[0]["application_date"] == to_iso_date(pd.Series(["令和7年1月15日"]))[0]
 
 
+def test_review_reports_transformer_keeps_first_keyword_match():
+    """Tests that only the first line for each keyword is used and missing keywords are None."""
+    mock_text = "販売名: 最初の錠\n申請者名: テスト製薬株式会社\n販売名: 二番目の錠"
+    transformer = ReviewReportsTransformer(source_url="http://example.com/report.pdf")
+    df = transformer.transform((mock_text, []))
+    assert df.iloc[0]["brand_name_jp"] == "最初の錠"
+    assert df.iloc[0]["applicant_name_jp"] == "テスト製薬株式会社"
+    assert df.iloc[0]["generic_name_jp"] is None
+
+
 # --- End-to-End Test for the CLI ---
 @patch("py_load_pmda.orchestrator.get_db_adapter")
 @patch("py_load_pmda.extractor.BaseExtractor._send_post_request")
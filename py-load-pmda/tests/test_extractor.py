@@ -68,6 +68,21 @@ def test_download_file_last_modified_match(extractor: BaseExtractor, requests_mo
     assert extractor.new_state == last_state
 
 
+def test_download_file_missing_cache(extractor: BaseExtractor, requests_mock: Any) -> None:
+    """Test that a file missing from the cache is downloaded despite a stored ETag."""
+    url = "http://test.com/file.txt"
+    last_state = {"etag": '"12345"', "last_modified": "Tue, 15 Nov 1994 12:45:26 GMT"}
+
+    requests_mock.get(url, content=b"content", headers={"ETag": '"12345"'})
+
+    file_path = extractor._download_file(url, last_state=last_state)
+
+    assert file_path.read_bytes() == b"content"
+    assert "If-None-Match" not in requests_mock.last_request.headers
+    assert "If-Modified-Since" not in requests_mock.last_request.headers
+    assert extractor.new_state == {"etag": '"12345"'}
+
+
 def test_download_file_mismatch(extractor: BaseExtractor, requests_mock: Any) -> None:
     """Test that the file is re-downloaded when headers do not match."""
     url = "http://test.com/file.txt"
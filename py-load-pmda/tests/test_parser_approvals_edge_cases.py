@@ -2,7 +2,6 @@ import pytest
 import pandas as pd
 from pathlib import Path
 from py_load_pmda.parser import ApprovalsParser
-import openpyxl
 
 @pytest.fixture
 def approvals_parser() -> ApprovalsParser:
@@ -37,3 +37,57 @@ def test_to_iso_date(input_date: Any, expected_date: Any) -> None:
         assert pd.isna(result_val)
     else:
         assert result_val == expected_date
+
+
+def test_to_iso_date_repeated_values() -> None:
+    """
+    Tests that repeated and missing values are converted per position and that
+    the original index and name are preserved.
+    """
+    input_series = pd.Series(
+        ["令和7年9月8日", None, "2023.01.15", "令和7年9月8日", None],
+        index=[10, 11, 12, 13, 14],
+        name="approval_date",
+    )
+
+    result_series = utils.to_iso_date(input_series)
+
+    assert result_series.index.tolist() == [10, 11, 12, 13, 14]
+    assert result_series.name == "approval_date"
+    assert result_series[10] == date(2025, 9, 8)
+    assert result_series[12] == date(2023, 1, 15)
+    assert result_series[13] == date(2025, 9, 8)
+    assert pd.isna(result_series[11]) and pd.isna(result_series[14])
+
+
+def test_to_iso_date_mixed_utc_offsets() -> None:
+    """
+    Tests that timestamps with different UTC offsets are each converted to the
+    date in their own offset.
+    """
+    input_series = pd.Series(["2023-04-01T23:00:00+09:00", "2023-04-02T01:00:00+01:00"])
+
+    result_series = utils.to_iso_date(input_series)
+
+    assert result_series.tolist() == [date(2023, 4, 1), date(2023, 4, 2)]
+
+
+def test_detect_encoding_ascii_prefix() -> None:
+    """
+    Tests that a long ASCII-only prefix does not hide the encoding of the
+    non-ASCII data that follows it.
+    """
+    data = b"id,value\n" * 10000 + "識別番号,副作用名,頭痛,発疹\n".encode("utf-8") * 50
+
+    assert utils.detect_encoding(data) == "utf-8"
+
+
+def test_detect_encoding_plain_ascii() -> None:
+    """
+    Tests that plain ASCII data is reported as ASCII, while 7-bit data carrying
+    ISO-2022-JP escape sequences is still detected as such.
+    """
+    assert utils.detect_encoding(b"id,value\n1,2\n" * 1000) == "ascii"
+
+    iso_2022_jp = "識別番号,副作用名\n頭痛,発疹\n".encode("iso-2022-jp") * 50
+    assert utils.detect_encoding(iso_2022_jp) == "ISO-2022-JP"
@@ -117,3 +117,18 @@ def test_missing_column(sample_df):
     validator = DataValidator(rules)
     assert validator.validate(sample_df) is False
     assert "Column 'non_existent_col' not found" in validator.errors[0]
+
+
+def test_numeric_rules_on_same_column():
+    """Test that numeric rules sharing a column are checked per DataFrame."""
+    rules = [
+        {"column": "age", "check": "has_type", "type": "integer"},
+        {"column": "age", "check": "is_in_range", "min_value": 0, "max_value": 100},
+    ]
+    validator = DataValidator(rules)
+    assert validator.validate(pd.DataFrame({"age": [25, "thirty", 150]})) is False
+    assert len(validator.errors) == 2
+    assert "contains non-integer values" in validator.errors[0]
+    assert "has 2 values outside the range" in validator.errors[1]
+
+    assert validator.validate(pd.DataFrame({"age": [25, 30, 35]})) is True